@@ -0,0 +1,91 @@
+"""Short-lived on-disk cache for network fetches."""
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from datetime import date
+from typing import Any, Callable, Optional
+
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.cache')
+
+
+def _date_suffix() -> str:
+    """Filename suffix for cache entries written today."""
+    return f"_{date.today():%Y%m%d}.pkl"
+
+
+def _cache_path(namespace: str, func_name: str, args: tuple, kwargs: dict) -> str:
+    """Get cache file path for a call, keyed by arguments and today's date."""
+    key = repr((args, sorted(kwargs.items()))).encode('utf-8')
+    digest = hashlib.sha1(key).hexdigest()[:16]
+    filename = f"{func_name}_{digest}{_date_suffix()}"
+    return os.path.join(CACHE_DIR, namespace, filename)
+
+
+def _prune_cache(directory: str) -> None:
+    """Delete entries from earlier dates, which no call can read anymore."""
+    suffix = _date_suffix()
+    try:
+        for entry in os.scandir(directory):
+            if entry.name.endswith('.pkl') and not entry.name.endswith(suffix):
+                os.remove(entry.path)
+    except OSError as e:
+        print(f"Warning: Could not prune cache directory: {e}")
+
+
+def _read_cache(path: str, ttl: float) -> Optional[Any]:
+    """Read a cached value if it exists and is younger than ttl seconds."""
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _write_cache(path: str, value: Any) -> None:
+    """Write a value to the cache atomically."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError) as e:
+        print(f"Warning: Could not write cache file: {e}")
+        return
+    _prune_cache(os.path.dirname(path))
+
+
+def ttl_disk_cache(ttl: float, namespace: str = 'yf') -> Callable:
+    """
+    Cache a function's results on disk for ttl seconds.
+
+    Entries persist across processes, so repeated cron runs within the
+    TTL reuse the previous result. Callers may pass cache_ttl=<seconds>
+    to override the default TTL for a single call (0 disables the cache).
+    Empty results (None or objects with .empty set) are not cached.
+    Entries from earlier dates are deleted whenever a new one is written.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, cache_ttl: Optional[float] = None, **kwargs):
+            max_age = ttl if cache_ttl is None else cache_ttl
+            path = _cache_path(namespace, func.__name__, args, kwargs)
+
+            if max_age > 0:
+                cached = _read_cache(path, max_age)
+                if cached is not None:
+                    return cached
+
+            value = func(*args, **kwargs)
+            if value is not None and not getattr(value, 'empty', False):
+                _write_cache(path, value)
+            return value
+        return wrapper
+    return decorator
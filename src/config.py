@@ -0,0 +1,72 @@
+"""Config file loading and YAML-to-JSON conversion."""
+
+import json
+import os
+from typing import Optional
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+JSON_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'config.json')
+YAML_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'config.yml')
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    """Get file modification time, or None if missing."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _load_yaml() -> Optional[dict]:
+    """Load config.yml, or return None if PyYAML isn't installed."""
+    try:
+        import yaml
+    except ImportError:
+        return None
+    with open(YAML_CONFIG_PATH, 'r') as f:
+        return yaml.safe_load(f)
+
+
+def load_config_file() -> Optional[dict]:
+    """
+    Load the user config file, or return None if there isn't one.
+
+    config.json is preferred since it avoids importing PyYAML at startup.
+    config.yml is read when there is no JSON config, or when it has been
+    edited since config.json was generated (if PyYAML is installed).
+    """
+    json_mtime = _get_mtime(JSON_CONFIG_PATH)
+    yaml_mtime = _get_mtime(YAML_CONFIG_PATH)
+
+    if json_mtime is not None and (yaml_mtime is None or yaml_mtime <= json_mtime):
+        with open(JSON_CONFIG_PATH, 'r') as f:
+            return json.load(f)
+
+    if yaml_mtime is not None:
+        if json_mtime is not None:
+            print("Warning: config.yml is newer than config.json; "
+                  "run 'python -m src.config' to regenerate it")
+        config = _load_yaml()
+        if config is not None or json_mtime is None:
+            return config
+        # No PyYAML: the stale JSON config is better than none
+        with open(JSON_CONFIG_PATH, 'r') as f:
+            return json.load(f)
+
+    return None
+
+
+def convert_yaml_to_json() -> None:
+    """Write config.json from config.yml."""
+    import yaml
+    with open(YAML_CONFIG_PATH, 'r') as f:
+        config = yaml.safe_load(f)
+    with open(JSON_CONFIG_PATH, 'w') as f:
+        json.dump(config, f, indent=2)
+        f.write("\n")
+    print(f"Wrote {JSON_CONFIG_PATH}")
+
+
+if __name__ == "__main__":
+    convert_yaml_to_json()
@@ -1,13 +1,15 @@
 """Market data fetching using yfinance."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
+import numpy as np
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
+from src.cache import ttl_disk_cache
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SymbolData:
     """Data for a single symbol."""
     symbol: str
@@ -19,13 +21,45 @@ class SymbolData:
     low_52w: Optional[float]
     sma_200: Optional[float]
     name: str
+    last_epsilon_dd: Optional[float] = None
 
 
-@dataclass
+# Structure-of-arrays keys on MarketSnapshot.arrays -> SymbolData attribute
+ARRAY_FIELDS = {
+    'last': 'current_price',
+    'prev': 'previous_close',
+    'd1': 'intraday_change_pct',
+    'd5': 'change_5d_pct',
+    'h52': 'high_52w',
+    'l52': 'low_52w',
+    'sma200': 'sma_200',
+    'eps_dd': 'last_epsilon_dd',
+}
+
+
+@dataclass(slots=True, frozen=True)
 class MarketSnapshot:
-    """Complete market snapshot with all tracked symbols."""
+    """
+    Complete market snapshot with all tracked symbols.
+
+    Alongside the per-symbol data, arrays holds one float array per
+    ARRAY_FIELDS key aligned with symbols (NaN for missing values), for
+    consumers that work column-wise. Both are derived from data if omitted.
+    """
     timestamp: datetime
     data: dict[str, SymbolData]
+    symbols: tuple[str, ...] = ()
+    arrays: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.arrays:
+            object.__setattr__(self, 'symbols', tuple(self.data))
+            object.__setattr__(self, 'arrays', {
+                key: np.array(
+                    [getattr(d, attr) for d in self.data.values()], dtype=np.float64,
+                )
+                for key, attr in ARRAY_FIELDS.items()
+            })
 
     def get(self, symbol: str) -> Optional[SymbolData]:
         """Get data for a specific symbol."""
@@ -46,83 +80,178 @@ SYMBOLS = {
     'BTC-USD': 'Bitcoin',
 }
 
+# How long (seconds) a downloaded history may be reused across runs.
+# Intraday alerts need fresh bars; the daily report only needs settled closes,
+# and caches its downloads separately so it never reuses an intraday one.
+ALERTS_CACHE_TTL = 60
+DAILY_CACHE_TTL = 3600
+DAILY_CACHE_NAMESPACE = 'yf_daily'
+
+# Epsilon-drawdown tolerance, in units of daily log-return volatility
+EPSILON_DD_TOLERANCE = 1.0
+# Symbols whose epsilon-drawdown is computed (only SPY's feeds the regime)
+EPSILON_DD_SYMBOLS = frozenset({'SPY'})
 
-def fetch_symbol_data(symbol: str, name: str) -> Optional[SymbolData]:
-    """Fetch data for a single symbol."""
-    try:
-        ticker = yf.Ticker(symbol)
 
-        # Get historical data for calculations
-        hist = ticker.history(period='1y')
-        if hist.empty:
-            return None
+def _download_histories(symbols: list[str], period: str = '1y') -> pd.DataFrame:
+    """Download daily history for all symbols in a single batched request."""
+    return yf.download(
+        " ".join(symbols),
+        period=period,
+        group_by='ticker',
+        threads=True,
+        auto_adjust=True,
+        progress=False,
+    )
+
+
+# Same download, cached per caller: alerts for a minute, the daily report
+# for an hour under its own namespace
+fetch_all_histories = ttl_disk_cache(ttl=ALERTS_CACHE_TTL)(_download_histories)
+fetch_daily_histories = ttl_disk_cache(
+    ttl=DAILY_CACHE_TTL, namespace=DAILY_CACHE_NAMESPACE,
+)(_download_histories)
+
 
-        current_price = hist['Close'].iloc[-1]
+def _field_matrix(histories: pd.DataFrame, price_field: str, symbols: list[str], min_rows: int = 0) -> np.ndarray:
+    """
+    Extract one price field as a (date x symbol) array with each column's
+    valid values shifted to the bottom.
 
-        # Previous close (day before last)
-        if len(hist) >= 2:
-            previous_close = hist['Close'].iloc[-2]
-        else:
-            previous_close = current_price
+    Rows are the union of all trading calendars (BTC trades weekends), so a
+    symbol's latest bars are not all on the same rows. Right-aligning each
+    column makes a[-1], a[-2], a[-6], a[-200:] refer to that symbol's own
+    last bars. Columns are padded with NaN on top to at least min_rows.
+    """
+    a = histories.xs(price_field, level=1, axis=1).reindex(columns=symbols).to_numpy(dtype=np.float64)
+    if a.shape[0] < min_rows:
+        a = np.vstack([np.full((min_rows - a.shape[0], a.shape[1]), np.nan), a])
+    order = np.argsort(~np.isnan(a), axis=0, kind='stable')
+    return np.take_along_axis(a, order, axis=0)
 
-        # Intraday change
-        intraday_change_pct = ((current_price - previous_close) / previous_close) * 100
 
-        # 5-day return
-        if len(hist) >= 6:
-            price_5d_ago = hist['Close'].iloc[-6]
-            change_5d_pct = ((current_price - price_5d_ago) / price_5d_ago) * 100
-        else:
-            change_5d_pct = None
+def compute_indicators(
+    histories: pd.DataFrame, symbols: list[str], epsilon_dd: bool = True,
+) -> dict[str, np.ndarray]:
+    """
+    Compute indicators for all symbols at once from a batched history.
 
-        # 52-week high/low
-        high_52w = hist['High'].max()
-        low_52w = hist['Low'].min()
+    Returns one array per indicator, aligned with symbols, with NaN where
+    a value is unavailable (e.g. not enough history; eps_dd is only set for
+    EPSILON_DD_SYMBOLS, and not at all with epsilon_dd=False):
+    count, last, prev, d1, d5, h52, l52, sma200, eps_dd.
+    """
+    closes = _field_matrix(histories, 'Close', symbols, min_rows=200)
+    highs = _field_matrix(histories, 'High', symbols)
+    lows = _field_matrix(histories, 'Low', symbols)
+    count = np.count_nonzero(~np.isnan(closes), axis=0)
 
+    last = closes[-1]
+    # Previous close (day before last)
+    prev = np.where(count >= 2, closes[-2], last)
+    # 5-day return
+    price_5d_ago = np.where(count >= 6, closes[-6], np.nan)
+
+    # Current epsilon-drawdown (volatility-scaled tolerance) as a percentage
+    eps_dd = np.full(len(symbols), np.nan)
+    if epsilon_dd:
+        # Imported here so only the daily report loads numba and JIT-compiles the kernel
+        from src.kernels import epsilon_drawdown
+        for i in np.flatnonzero(count >= 2):
+            if symbols[i] not in EPSILON_DD_SYMBOLS:
+                continue
+            log_returns = np.diff(np.log(closes[-count[i]:, i]))
+            drawdown = epsilon_drawdown(log_returns, EPSILON_DD_TOLERANCE, log_returns.std())
+            eps_dd[i] = np.expm1(drawdown) * 100
+
+    return {
+        'count': count,
+        'last': last,
+        'prev': prev,
+        'd1': ((last - prev) / prev) * 100,
+        'd5': ((last - price_5d_ago) / price_5d_ago) * 100,
+        # 52-week high/low (fmax/fmin skip NaN without warning)
+        'h52': np.fmax.reduce(highs, axis=0),
+        'l52': np.fmin.reduce(lows, axis=0),
         # 200-day SMA
-        if len(hist) >= 200:
-            sma_200 = hist['Close'].tail(200).mean()
-        else:
-            sma_200 = None
-
-        return SymbolData(
-            symbol=symbol,
-            current_price=current_price,
-            previous_close=previous_close,
-            intraday_change_pct=intraday_change_pct,
-            change_5d_pct=change_5d_pct,
-            high_52w=high_52w,
-            low_52w=low_52w,
-            sma_200=sma_200,
-            name=name,
-        )
-    except Exception as e:
-        print(f"Error fetching {symbol}: {e}")
-        return None
+        'sma200': np.where(count >= 200, closes[-200:].mean(axis=0), np.nan),
+        'eps_dd': eps_dd,
+    }
 
 
-def fetch_market_snapshot() -> MarketSnapshot:
-    """Fetch complete market snapshot for all tracked symbols."""
+def _optional(value: float) -> Optional[float]:
+    """Map NaN to None for optional SymbolData fields."""
+    return None if np.isnan(value) else value
+
+
+def _build_snapshot(histories: pd.DataFrame, epsilon_dd: bool) -> MarketSnapshot:
+    """
+    Build a snapshot of all tracked symbols from a batched history.
+
+    epsilon_dd=False skips the epsilon-drawdown scan and leaves
+    last_epsilon_dd unset.
+    """
     data = {}
+    symbols = list(SYMBOLS)
 
-    for symbol, name in SYMBOLS.items():
-        symbol_data = fetch_symbol_data(symbol, name)
-        if symbol_data:
-            data[symbol] = symbol_data
+    arrays = {}
+    if not histories.empty:
+        ind = compute_indicators(histories, symbols, epsilon_dd=epsilon_dd)
+        present = ind['count'] > 0
+        arrays = {key: ind[key][present] for key in ARRAY_FIELDS}
+        for i, (symbol, name) in enumerate(SYMBOLS.items()):
+            if not present[i]:
+                print(f"Error fetching {symbol}: no data returned")
+                continue
+            data[symbol] = SymbolData(
+                symbol=symbol,
+                current_price=ind['last'][i],
+                previous_close=ind['prev'][i],
+                intraday_change_pct=ind['d1'][i],
+                change_5d_pct=_optional(ind['d5'][i]),
+                high_52w=_optional(ind['h52'][i]),
+                low_52w=_optional(ind['l52'][i]),
+                sma_200=_optional(ind['sma200'][i]),
+                name=name,
+                last_epsilon_dd=_optional(ind['eps_dd'][i]),
+            )
 
     return MarketSnapshot(
         timestamp=datetime.now(),
         data=data,
+        symbols=tuple(data),
+        arrays=arrays,
     )
 
 
-def get_vix_previous_close() -> Optional[float]:
-    """Get VIX previous close for spike detection."""
+def fetch_market_snapshot(cache_ttl: float = DAILY_CACHE_TTL) -> MarketSnapshot:
+    """Fetch complete market snapshot for all tracked symbols (daily report)."""
     try:
-        ticker = yf.Ticker('^VIX')
-        hist = ticker.history(period='5d')
-        if len(hist) >= 2:
-            return hist['Close'].iloc[-2]
-        return None
-    except Exception:
-        return None
+        histories = fetch_daily_histories(list(SYMBOLS), cache_ttl=cache_ttl)
+    except Exception as e:
+        print(f"Error fetching market data: {e}")
+        histories = pd.DataFrame()
+
+    return _build_snapshot(histories, epsilon_dd=True)
+
+
+def fetch_fast_snapshot(cache_ttl: float = ALERTS_CACHE_TTL) -> MarketSnapshot:
+    """
+    Fetch a market snapshot for intraday alerts.
+
+    Uses the same batched download as the daily report, under the short
+    alerts cache, and skips the epsilon-drawdown, which no alert rule reads.
+    """
+    try:
+        histories = fetch_all_histories(list(SYMBOLS), cache_ttl=cache_ttl)
+    except Exception as e:
+        print(f"Error fetching market data: {e}")
+        histories = pd.DataFrame()
+
+    return _build_snapshot(histories, epsilon_dd=False)
+
+
+def get_vix_previous_close(snapshot: MarketSnapshot) -> Optional[float]:
+    """Get VIX previous close for spike detection (already in the snapshot)."""
+    vix = snapshot.get('^VIX')
+    return vix.previous_close if vix else None
@@ -1,14 +1,16 @@
 """Calculated market indicators and metrics."""
 
+import functools
 from typing import Optional
 from src.data import MarketSnapshot, SymbolData
 
 
 def get_drawdown_from_high(symbol_data: SymbolData) -> Optional[float]:
     """Calculate drawdown from 52-week high as percentage."""
-    if symbol_data.high_52w is None or symbol_data.high_52w == 0:
+    high = symbol_data.high_52w
+    if not high:
         return None
-    return ((symbol_data.current_price - symbol_data.high_52w) / symbol_data.high_52w) * 100
+    return ((symbol_data.current_price - high) / high) * 100
 
 
 def get_5d_return(symbol_data: SymbolData) -> Optional[float]:
@@ -83,6 +85,7 @@ def get_risk_appetite_score(snapshot: MarketSnapshot) -> dict:
     return metrics
 
 
+@functools.lru_cache(maxsize=512)
 def format_pct(value: Optional[float], decimals: int = 2) -> str:
     """Format percentage value for display."""
     if value is None:
@@ -91,6 +94,7 @@ def format_pct(value: Optional[float], decimals: int = 2) -> str:
     return f"{sign}{value:.{decimals}f}%"
 
 
+@functools.lru_cache(maxsize=512)
 def format_price(value: float, symbol: str = "") -> str:
     """Format price for display based on symbol type."""
     if symbol in ['^TNX']:
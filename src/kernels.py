@@ -0,0 +1,37 @@
+"""Compiled numeric kernels for indicator calculations over price history."""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; fall back to plain Python loops
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def epsilon_drawdown(log_returns: np.ndarray, eps: float, sigma: float) -> float:
+    """
+    Depth of the epsilon-drawdown in progress at the end of a return series.
+
+    A drawdown starts at a local peak of cumulative log return and only ends
+    once price rebounds from its running minimum by more than eps * sigma, so
+    counter-moves smaller than that tolerance are absorbed into the drawdown.
+    Returns the (non-positive) cumulative log return from peak to trough.
+    """
+    tolerance = eps * sigma
+    cum = 0.0
+    peak = 0.0
+    trough = 0.0
+    for r in log_returns:
+        cum += r
+        if cum < trough:
+            trough = cum
+        elif cum >= peak or cum - trough > tolerance:
+            # New high, or a rebound big enough to end the drawdown
+            peak = cum
+            trough = cum
+    return trough - peak
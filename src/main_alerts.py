@@ -1,17 +1,18 @@
 """Intraday alerts entry point."""
 
 import sys
-from src.data import fetch_market_snapshot
+from operator import attrgetter
+from src.data import fetch_fast_snapshot
 from src.rules import evaluate_rules
-from src.storage import should_fire, record_fire
+from src.storage import filter_due, record_fires
 from src.render import render_alert, render_multiple_alerts
-from src.telegram import send_message_safe
+from src.telegram import send_messages_safe
 
 
 def main():
     """Main entry point for intraday alert checks."""
     print("Fetching market data...")
-    snapshot = fetch_market_snapshot()
+    snapshot = fetch_fast_snapshot()
 
     if not snapshot.data:
         print("Error: No market data fetched")
@@ -30,10 +31,10 @@ def main():
     print(f"{len(triggered)} rule(s) triggered before cooldown check")
 
     # Filter by cooldowns
-    alerts_to_send = []
+    alerts_to_send = filter_due(triggered)
+    due_names = {tr.rule.name for tr in alerts_to_send}
     for tr in triggered:
-        if should_fire(tr.rule.name, tr.rule.severity):
-            alerts_to_send.append(tr)
+        if tr.rule.name in due_names:
             print(f"  FIRE: {tr.rule.name} ({tr.rule.severity.value})")
         else:
             print(f"  SKIP (cooldown): {tr.rule.name}")
@@ -43,32 +44,24 @@ def main():
         return
 
     # Sort by severity (critical first)
-    severity_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-    alerts_to_send.sort(key=lambda tr: severity_order.get(tr.rule.severity.value, 99))
+    alerts_to_send.sort(key=attrgetter('rule.severity.rank'))
 
     # Send alerts
     print(f"Sending {len(alerts_to_send)} alert(s)...")
 
     if len(alerts_to_send) <= 3:
-        # Send individual alerts
-        for tr in alerts_to_send:
-            message = render_alert(tr, snapshot)
-            success = send_message_safe(message)
-            if success:
-                record_fire(tr.rule.name)
-                print(f"  Sent: {tr.rule.name}")
-            else:
-                print(f"  FAILED: {tr.rule.name}")
+        # Send each alert in full, batched into as few messages as possible
+        messages = [render_alert(tr, snapshot) for tr in alerts_to_send]
     else:
-        # Combine into single message to avoid spam
-        message = render_multiple_alerts(alerts_to_send, snapshot)
-        success = send_message_safe(message)
-        if success:
-            for tr in alerts_to_send:
-                record_fire(tr.rule.name)
-            print(f"  Sent combined alert with {len(alerts_to_send)} signals")
-        else:
-            print("  FAILED to send combined alert")
+        # Combine into single summary to avoid spam
+        messages = [render_multiple_alerts(alerts_to_send, snapshot)]
+
+    success = send_messages_safe(messages)
+    if success:
+        record_fires([tr.rule.name for tr in alerts_to_send])
+        print(f"  Sent {len(alerts_to_send)} signal(s)")
+    else:
+        print("  FAILED to send alerts")
 
     print("Done")
 
@@ -1,7 +1,7 @@
 """Daily report entry point."""
 
 import sys
-from src.data import fetch_market_snapshot
+from src.data import fetch_market_snapshot, DAILY_CACHE_TTL
 from src.rules import evaluate_rules
 from src.regime import assess_regime
 from src.render import render_daily_report
@@ -11,7 +11,7 @@ from src.telegram import send_message_safe
 def main():
     """Main entry point for daily market report."""
     print("Fetching market data...")
-    snapshot = fetch_market_snapshot()
+    snapshot = fetch_market_snapshot(cache_ttl=DAILY_CACHE_TTL)
 
     if not snapshot.data:
         print("Error: No market data fetched")
@@ -1,9 +1,10 @@
 """Market regime assessment (NORMAL vs DEFENSIVE)."""
 
+import functools
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
-from src.data import MarketSnapshot, get_vix_previous_close
+from src.config import load_config_file
+from src.data import MarketSnapshot
 from src.indicators import is_below_200dma
 
 
@@ -13,7 +14,7 @@ class Regime(Enum):
     DEFENSIVE = "DEFENSIVE"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegimeAssessment:
     """Result of regime assessment with reasoning."""
     regime: Regime
@@ -21,18 +22,13 @@ class RegimeAssessment:
     summary: str
 
 
+@functools.lru_cache(maxsize=1)
 def load_regime_thresholds() -> dict:
-    """Load regime thresholds from config."""
-    import os
+    """Load regime thresholds from config (parsed once per process)."""
     try:
-        import yaml
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yml')
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                return config.get('regime', {})
-    except ImportError:
-        pass
+        config = load_config_file()
+        if config is not None:
+            return config.get('regime', {})
     except Exception:
         pass
 
@@ -42,6 +38,7 @@ def load_regime_thresholds() -> dict:
         'dxy_5d_threshold': 2.0,
         'vix_level_threshold': 30,
         'spy_tlt_combined_threshold': -2.5,
+        'spy_epsilon_dd_threshold': -8.0,
     }
 
 
@@ -54,49 +51,52 @@ def assess_regime(snapshot: MarketSnapshot) -> RegimeAssessment:
     - DXY 5d return >= +2.0%
     - VIX >= 30 AND rising (today > yesterday)
     - SPY <= -2.5% AND TLT < 0 same day
+    - SPY epsilon-drawdown <= -8.0%
     - (Optional) SPY < 200dma AND rates rising
     """
     thresholds = load_regime_thresholds()
+    hyg_threshold = thresholds.get('hyg_5d_threshold', -3.0)
+    dxy_threshold = thresholds.get('dxy_5d_threshold', 2.0)
+    vix_threshold = thresholds.get('vix_level_threshold', 30)
+    spy_threshold = thresholds.get('spy_tlt_combined_threshold', -2.5)
+    eps_dd_threshold = thresholds.get('spy_epsilon_dd_threshold', -8.0)
     triggers = []
 
     # Check HYG 5d stress
     hyg = snapshot.get('HYG')
     if hyg and hyg.change_5d_pct is not None:
-        hyg_threshold = thresholds.get('hyg_5d_threshold', -3.0)
         if hyg.change_5d_pct <= hyg_threshold:
             triggers.append(f"Credit stress: HYG 5D return {hyg.change_5d_pct:.1f}%")
 
     # Check DXY 5d strength
     dxy = snapshot.get('DX-Y.NYB')
     if dxy and dxy.change_5d_pct is not None:
-        dxy_threshold = thresholds.get('dxy_5d_threshold', 2.0)
         if dxy.change_5d_pct >= dxy_threshold:
             triggers.append(f"Liquidity tightening: DXY 5D return +{dxy.change_5d_pct:.1f}%")
 
     # Check VIX elevated AND rising
     vix = snapshot.get('^VIX')
-    if vix:
-        vix_threshold = thresholds.get('vix_level_threshold', 30)
-        if vix.current_price >= vix_threshold:
-            vix_prev = get_vix_previous_close()
-            if vix_prev is not None and vix.current_price > vix_prev:
-                triggers.append(f"Elevated and rising volatility: VIX {vix.current_price:.1f} (prev: {vix_prev:.1f})")
-            elif vix_prev is None:
-                triggers.append(f"Elevated volatility: VIX {vix.current_price:.1f}")
+    if vix and vix.current_price >= vix_threshold:
+        if vix.current_price > vix.previous_close:
+            triggers.append(f"Elevated and rising volatility: VIX {vix.current_price:.1f} (prev: {vix.previous_close:.1f})")
 
     # Check combined SPY + TLT stress
     spy = snapshot.get('SPY')
     tlt = snapshot.get('TLT')
     if spy and tlt:
-        spy_threshold = thresholds.get('spy_tlt_combined_threshold', -2.5)
         if spy.intraday_change_pct <= spy_threshold and tlt.intraday_change_pct < 0:
             triggers.append(f"Combined stress: SPY {spy.intraday_change_pct:.1f}% and TLT {tlt.intraday_change_pct:.1f}%")
 
+    # Check sustained SPY drawdown (noise-tolerant epsilon-drawdown)
+    if spy and spy.last_epsilon_dd is not None:
+        if spy.last_epsilon_dd <= eps_dd_threshold:
+            triggers.append(f"Sustained drawdown: SPY epsilon-drawdown {spy.last_epsilon_dd:.1f}%")
+
     # Check structural weakness (SPY below 200dma with rates rising)
     if spy and is_below_200dma(spy):
         tnx = snapshot.get('^TNX')
         if tnx and tnx.intraday_change_pct > 0:
-            triggers.append(f"Structural weakness: SPY below 200dma with rates rising")
+            triggers.append("Structural weakness: SPY below 200dma with rates rising")
 
     # Determine regime
     if triggers:
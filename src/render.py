@@ -1,6 +1,7 @@
 """Telegram message rendering and formatting."""
 
-from datetime import datetime
+from collections import defaultdict
+from math import isnan
 from typing import Optional
 from src.data import MarketSnapshot
 from src.rules import TriggeredRule, Severity
@@ -8,14 +9,30 @@ from src.regime import RegimeAssessment, Regime, get_regime_emoji, get_regime_ac
 from src.indicators import format_pct, format_price, get_drawdown_from_high
 
 
+_SEVERITY_EMOJI = {
+    Severity.CRITICAL: "🚨",
+    Severity.HIGH: "⚠️",
+    Severity.MEDIUM: "📊",
+    Severity.LOW: "ℹ️",
+}
+
+# Display order for triggered signals (most severe first)
+_SEV_ORDER = (Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW)
+
+# Market snapshot table: (section title, ((symbol, label), ...), show 5D column)
+_SNAPSHOT_SECTIONS = (
+    ("Equities:", (('SPY', 'SPY'), ('QQQ', 'QQQ'), ('IWM', 'IWM')), True),
+    ("Rates & Bonds:", (('^TNX', '10Y'), ('TLT', 'TLT'), ('HYG', 'HYG')), True),
+    ("Risk Indicators:", (('^VIX', 'VIX'), ('DX-Y.NYB', 'DXY')), False),
+    ("Alternatives:", (('GLD', 'GLD'), ('BTC-USD', 'BTC')), True),
+)
+_ROW_TMPL = "  {label:6} {price:>10}  1D:{d1:>7}  5D:{d5:>7}"
+_ROW_TMPL_1D = "  {label:6} {price:>10}  1D:{d1:>7}"
+
+
 def get_severity_emoji(severity: Severity) -> str:
     """Get emoji for severity level."""
-    return {
-        Severity.CRITICAL: "🚨",
-        Severity.HIGH: "⚠️",
-        Severity.MEDIUM: "📊",
-        Severity.LOW: "ℹ️",
-    }.get(severity, "📌")
+    return _SEVERITY_EMOJI.get(severity, "📌")
 
 
 def get_change_emoji(change: float) -> str:
@@ -30,29 +47,32 @@ def get_change_emoji(change: float) -> str:
         return "🔴"
 
 
-def render_alert(triggered: TriggeredRule, snapshot: MarketSnapshot) -> str:
-    """Render a single alert message."""
+def _format_message(triggered: TriggeredRule, fallback: str) -> str:
+    """Fill a rule's message template, or return fallback if values are missing."""
     rule = triggered.rule
-    emoji = get_severity_emoji(rule.severity)
-
-    # Build message from template
     format_args = {}
     if triggered.value is not None:
         format_args['value'] = triggered.value
     if triggered.extra_context:
         format_args.update(triggered.extra_context)
 
-    try:
-        message_body = rule.message_template.format(**format_args)
-    except KeyError:
-        message_body = rule.message_template
+    if rule.template_keys.issubset(format_args):
+        return rule.message_template.format_map(format_args)
+    return fallback
+
+
+def render_alert(triggered: TriggeredRule, snapshot: MarketSnapshot) -> str:
+    """Render a single alert message."""
+    rule = triggered.rule
+    emoji = get_severity_emoji(rule.severity)
+    message_body = _format_message(triggered, rule.message_template)
 
     lines = [
         f"{emoji} *{rule.severity.value.upper()}* - {rule.category}",
         "",
         message_body,
         "",
-        f"_{datetime.now().strftime('%H:%M:%S ET')}_",
+        f"_{snapshot.timestamp.strftime('%H:%M:%S ET')}_",
     ]
 
     return "\n".join(lines)
@@ -89,41 +109,23 @@ def render_daily_report(
     lines.append("*Market Snapshot*")
     lines.append("```")
 
-    # Equities section
-    lines.append("Equities:")
-    for sym in ['SPY', 'QQQ', 'IWM']:
-        data = snapshot.get(sym)
-        if data:
-            change_1d = format_pct(data.intraday_change_pct)
-            change_5d = format_pct(data.change_5d_pct) if data.change_5d_pct else "N/A"
-            lines.append(f"  {sym:6} {format_price(data.current_price):>10}  1D:{change_1d:>7}  5D:{change_5d:>7}")
-
-    # Rates & Bonds
-    lines.append("Rates & Bonds:")
-    for sym, label in [('^TNX', '10Y'), ('TLT', 'TLT'), ('HYG', 'HYG')]:
-        data = snapshot.get(sym)
-        if data:
-            change_1d = format_pct(data.intraday_change_pct)
-            change_5d = format_pct(data.change_5d_pct) if data.change_5d_pct else "N/A"
-            lines.append(f"  {label:6} {format_price(data.current_price, sym):>10}  1D:{change_1d:>7}  5D:{change_5d:>7}")
-
-    # Risk Indicators
-    lines.append("Risk Indicators:")
-    for sym, label in [('^VIX', 'VIX'), ('DX-Y.NYB', 'DXY')]:
-        data = snapshot.get(sym)
-        if data:
-            change_1d = format_pct(data.intraday_change_pct)
-            lines.append(f"  {label:6} {format_price(data.current_price, sym):>10}  1D:{change_1d:>7}")
-
-    # Alternatives
-    lines.append("Alternatives:")
-    for sym in ['GLD', 'BTC-USD']:
-        data = snapshot.get(sym)
-        if data:
-            change_1d = format_pct(data.intraday_change_pct)
-            change_5d = format_pct(data.change_5d_pct) if data.change_5d_pct else "N/A"
-            label = 'GLD' if sym == 'GLD' else 'BTC'
-            lines.append(f"  {label:6} {format_price(data.current_price, sym):>10}  1D:{change_1d:>7}  5D:{change_5d:>7}")
+    # Format each column once over the snapshot arrays
+    arrays = snapshot.arrays
+    position = {sym: i for i, sym in enumerate(snapshot.symbols)}
+    prices = [format_price(p, sym) for p, sym in zip(arrays['last'], snapshot.symbols)]
+    changes_1d = [format_pct(v) for v in arrays['d1']]
+    changes_5d = ["N/A" if not v or isnan(v) else format_pct(v) for v in arrays['d5']]
+
+    for title, rows, show_5d in _SNAPSHOT_SECTIONS:
+        lines.append(title)
+        for sym, label in rows:
+            i = position.get(sym)
+            if i is None:
+                continue
+            if show_5d:
+                lines.append(_ROW_TMPL.format(label=label, price=prices[i], d1=changes_1d[i], d5=changes_5d[i]))
+            else:
+                lines.append(_ROW_TMPL_1D.format(label=label, price=prices[i], d1=changes_1d[i]))
 
     lines.append("```")
     lines.append("")
@@ -140,18 +142,14 @@ def render_daily_report(
     if triggered_rules:
         lines.append("*Signals Triggered*")
         # Group by severity
-        by_severity = {}
+        by_severity = defaultdict(list)
         for tr in triggered_rules:
-            sev = tr.rule.severity
-            if sev not in by_severity:
-                by_severity[sev] = []
-            by_severity[sev].append(tr)
-
-        for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]:
-            if severity in by_severity:
-                emoji = get_severity_emoji(severity)
-                for tr in by_severity[severity]:
-                    lines.append(f"  {emoji} {tr.rule.name}")
+            by_severity[tr.rule.severity].append(tr)
+
+        for severity in _SEV_ORDER:
+            emoji = get_severity_emoji(severity)
+            for tr in by_severity.get(severity, ()):
+                lines.append(f"  {emoji} {tr.rule.name}")
     else:
         lines.append("_No alert signals triggered_")
 
@@ -213,23 +211,13 @@ def render_multiple_alerts(triggered_rules: list[TriggeredRule], snapshot: Marke
 
     lines = [
         f"*🔔 {len(triggered_rules)} Alerts Triggered*",
-        f"_{datetime.now().strftime('%H:%M:%S ET')}_",
+        f"_{snapshot.timestamp.strftime('%H:%M:%S ET')}_",
         "",
     ]
 
     for tr in triggered_rules:
         emoji = get_severity_emoji(tr.rule.severity)
-        format_args = {}
-        if tr.value is not None:
-            format_args['value'] = tr.value
-        if tr.extra_context:
-            format_args.update(tr.extra_context)
-
-        try:
-            message_body = tr.rule.message_template.format(**format_args)
-        except KeyError:
-            message_body = tr.rule.description
-
+        message_body = _format_message(tr, tr.rule.description)
         lines.append(f"{emoji} *{tr.rule.severity.value.upper()}*: {message_body}")
 
     return "\n".join(lines)
@@ -1,9 +1,15 @@
 """Rule registry with severity levels and cooldowns."""
 
-from dataclasses import dataclass
+import operator
+from bisect import bisect_left
+import string
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
 from enum import Enum
 from typing import Callable, Optional
-from src.data import MarketSnapshot
+from src.config import load_config_file
+from src.data import MarketSnapshot, SymbolData
 from src.indicators import (
     get_drawdown_from_high,
     get_5d_return,
@@ -13,26 +19,45 @@ from src.indicators import (
 )
 
 
+# Symbol -> data for the symbols present in a snapshot (MarketSnapshot.data)
+Quotes = dict[str, SymbolData]
+
+
 class Severity(Enum):
-    """Alert severity levels."""
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
+    """Alert severity levels, with rank 0 being the most severe."""
+    CRITICAL = ("critical", 0)
+    HIGH = ("high", 1)
+    MEDIUM = ("medium", 2)
+    LOW = ("low", 3)
 
+    def __new__(cls, value: str, rank: int):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.rank = rank
+        return member
 
-@dataclass
+
+@dataclass(slots=True)
 class Rule:
     """Definition of an alert rule."""
     name: str
     severity: Severity
     category: str
     description: str
-    check: Callable[[MarketSnapshot, dict], bool]
+    check: Callable[[Quotes, dict], bool]
     message_template: str
+    # Snapshot symbols the check reads; the rule is skipped when any is missing
+    symbols: tuple[str, ...]
+    template_keys: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Placeholders the message template needs, parsed once at definition
+        self.template_keys = frozenset(
+            key for _, key, _, _ in string.Formatter().parse(self.message_template) if key
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggeredRule:
     """A rule that has been triggered with context."""
     rule: Rule
@@ -41,47 +66,48 @@ class TriggeredRule:
     extra_context: Optional[dict] = None
 
 
+# Defaults for any threshold or cooldown missing from config
+DEFAULT_THRESHOLDS = {
+    'credit_stress_intraday': -1.5,
+    'credit_stress_5d': -3.0,
+    'liquidity_stress_intraday': 1.0,
+    'liquidity_stress_5d': 2.0,
+    'volatility_level': 30,
+    'volatility_spike': 8,
+    'spy_drawdown_levels': [-2, -4, -6, -10, -15, -20],
+    'growth_weakness_threshold': -1.5,
+    'smallcap_weakness_threshold': -2.0,
+    'defensive_hedge_bid': 1.5,
+    'rate_shock_bps': 15,
+}
+DEFAULT_COOLDOWNS = {'critical': 45, 'high': 90, 'medium': 240, 'low': 1440}
+
+
 def load_config() -> dict:
-    """Load configuration from config.yml or use defaults."""
-    import os
+    """Load configuration from config.json / config.yml or use defaults."""
     try:
-        import yaml
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yml')
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
-    except ImportError:
-        pass
+        config = load_config_file()
+        if config is not None:
+            return config
     except Exception as e:
-        print(f"Warning: Could not load config.yml: {e}")
+        print(f"Warning: Could not load config: {e}")
 
     # Return defaults
     return {
-        'rules': {
-            'credit_stress_intraday': -1.5,
-            'credit_stress_5d': -3.0,
-            'liquidity_stress_intraday': 1.0,
-            'liquidity_stress_5d': 2.0,
-            'volatility_level': 30,
-            'volatility_spike': 8,
-            'spy_drawdown_levels': [-2, -4, -6, -10, -15, -20],
-            'growth_weakness_threshold': -1.5,
-            'smallcap_weakness_threshold': -2.0,
-            'defensive_hedge_bid': 1.5,
-            'rate_shock_bps': 15,
-        },
-        'cooldowns': {
-            'critical': 45,
-            'high': 90,
-            'medium': 240,
-            'low': 1440,
-        }
+        'rules': dict(DEFAULT_THRESHOLDS),
+        'cooldowns': dict(DEFAULT_COOLDOWNS),
     }
 
 
 # Global config - loaded once
 _config = None
 
+# Flattened rule thresholds and per-severity cooldowns (minutes and as timedeltas),
+# filled by _load_tables
+_THRESHOLDS: dict = {}
+_COOLDOWNS: dict[Severity, int] = {}
+_COOLDOWN_DELTAS: dict[Severity, timedelta] = {}
+
 
 def get_config() -> dict:
     """Get or load config."""
@@ -91,107 +117,72 @@ def get_config() -> dict:
     return _config
 
 
-def get_threshold(key: str, default: float) -> float:
-    """Get a threshold value from config."""
-    config = get_config()
-    rules = config.get('rules', {})
-    return rules.get(key, default)
+def _load_tables() -> None:
+    """Re-read config and refill the threshold and cooldown tables in place."""
+    global _config
+    _config = load_config()
 
+    _THRESHOLDS.clear()
+    _THRESHOLDS.update(DEFAULT_THRESHOLDS)
+    _THRESHOLDS.update(_config.get('rules') or {})
 
-def get_cooldown_minutes(severity: Severity) -> int:
-    """Get cooldown duration in minutes for a severity level."""
-    config = get_config()
-    cooldowns = config.get('cooldowns', {})
-    defaults = {'critical': 45, 'high': 90, 'medium': 240, 'low': 1440}
-    return cooldowns.get(severity.value, defaults.get(severity.value, 60))
+    cooldowns = {**DEFAULT_COOLDOWNS, **(_config.get('cooldowns') or {})}
+    _COOLDOWNS.clear()
+    _COOLDOWNS.update({severity: cooldowns.get(severity.value, 60) for severity in Severity})
+    _COOLDOWN_DELTAS.clear()
+    _COOLDOWN_DELTAS.update({severity: timedelta(minutes=m) for severity, m in _COOLDOWNS.items()})
 
 
-# Rule definitions
-def check_credit_stress_intraday(snapshot: MarketSnapshot, ctx: dict) -> bool:
-    """Check for intraday credit stress via HYG."""
-    hyg = snapshot.get('HYG')
-    if hyg is None:
-        return False
-    threshold = get_threshold('credit_stress_intraday', -1.5)
-    triggered = hyg.intraday_change_pct <= threshold
-    if triggered:
-        ctx['value'] = hyg.intraday_change_pct
-        ctx['symbol'] = 'HYG'
-    return triggered
+_load_tables()
 
 
-def check_credit_stress_5d(snapshot: MarketSnapshot, ctx: dict) -> bool:
-    """Check for 5-day credit stress via HYG."""
-    hyg = snapshot.get('HYG')
-    if hyg is None or hyg.change_5d_pct is None:
-        return False
-    threshold = get_threshold('credit_stress_5d', -3.0)
-    triggered = hyg.change_5d_pct <= threshold
-    if triggered:
-        ctx['value'] = hyg.change_5d_pct
-        ctx['symbol'] = 'HYG'
-    return triggered
-
-
-def check_liquidity_stress_intraday(snapshot: MarketSnapshot, ctx: dict) -> bool:
-    """Check for intraday liquidity stress via DXY spike."""
-    dxy = snapshot.get('DX-Y.NYB')
-    if dxy is None:
-        return False
-    threshold = get_threshold('liquidity_stress_intraday', 1.0)
-    triggered = dxy.intraday_change_pct >= threshold
-    if triggered:
-        ctx['value'] = dxy.intraday_change_pct
-        ctx['symbol'] = 'DXY'
-    return triggered
-
+def get_cooldown_minutes(severity: Severity) -> int:
+    """Get cooldown duration in minutes for a severity level."""
+    return _COOLDOWNS[severity]
 
-def check_liquidity_stress_5d(snapshot: MarketSnapshot, ctx: dict) -> bool:
-    """Check for 5-day liquidity stress via DXY."""
-    dxy = snapshot.get('DX-Y.NYB')
-    if dxy is None or dxy.change_5d_pct is None:
-        return False
-    threshold = get_threshold('liquidity_stress_5d', 2.0)
-    triggered = dxy.change_5d_pct >= threshold
-    if triggered:
-        ctx['value'] = dxy.change_5d_pct
-        ctx['symbol'] = 'DXY'
-    return triggered
 
+def get_cooldown_delta(severity: Severity) -> timedelta:
+    """Get cooldown duration for a severity level as a timedelta."""
+    return _COOLDOWN_DELTAS[severity]
 
-def check_volatility_elevated(snapshot: MarketSnapshot, ctx: dict) -> bool:
-    """Check if VIX is at elevated levels."""
-    vix = snapshot.get('^VIX')
-    if vix is None:
-        return False
-    threshold = get_threshold('volatility_level', 30)
-    triggered = vix.current_price >= threshold
-    if triggered:
-        ctx['value'] = vix.current_price
-        ctx['symbol'] = 'VIX'
-    return triggered
 
-
-def check_volatility_spike(snapshot: MarketSnapshot, ctx: dict) -> bool:
-    """Check for VIX spike (large intraday move)."""
-    vix = snapshot.get('^VIX')
-    if vix is None:
-        return False
-    threshold = get_threshold('volatility_spike', 8)
-    triggered = vix.intraday_change_pct >= threshold
-    if triggered:
-        ctx['value'] = vix.intraday_change_pct
-        ctx['symbol'] = 'VIX'
-    return triggered
+# Rule definitions
+# Field getters for threshold checks (C-level callables, built once)
+_get_intraday = operator.attrgetter('intraday_change_pct')
+_get_5d = operator.attrgetter('change_5d_pct')
+_get_price = operator.attrgetter('current_price')
+
+
+def make_threshold_check(
+    symbol: str,
+    get: Callable[[SymbolData], Optional[float]],
+    op: Callable[[float, float], bool],
+    threshold: float,
+    label: str,
+) -> Callable[[Quotes, dict], bool]:
+    """
+    Factory for single-symbol rules comparing one field against a threshold.
+
+    The threshold is resolved once and captured in the closure, so the
+    check does no config lookups when evaluated.
+    """
+    def check(quotes: Quotes, ctx: dict) -> bool:
+        value = get(quotes[symbol])
+        if value is None:
+            return False
+        triggered = op(value, threshold)
+        if triggered:
+            ctx['value'] = value
+            ctx['symbol'] = label
+        return triggered
+    return check
 
 
-def check_growth_weakness(snapshot: MarketSnapshot, ctx: dict) -> bool:
+def check_growth_weakness(quotes: Quotes, ctx: dict) -> bool:
     """Check for growth/tech weakness (QQQ underperforming SPY)."""
-    qqq = snapshot.get('QQQ')
-    spy = snapshot.get('SPY')
-    if qqq is None or spy is None:
-        return False
-    threshold = get_threshold('growth_weakness_threshold', -1.5)
+    qqq = quotes['QQQ']
+    spy = quotes['SPY']
+    threshold = _THRESHOLDS['growth_weakness_threshold']
     relative_perf = qqq.intraday_change_pct - spy.intraday_change_pct
     triggered = relative_perf <= threshold
     if triggered:
@@ -200,13 +191,11 @@ def check_growth_weakness(snapshot: MarketSnapshot, ctx: dict) -> bool:
     return triggered
 
 
-def check_smallcap_weakness(snapshot: MarketSnapshot, ctx: dict) -> bool:
+def check_smallcap_weakness(quotes: Quotes, ctx: dict) -> bool:
     """Check for small cap weakness (IWM underperforming SPY)."""
-    iwm = snapshot.get('IWM')
-    spy = snapshot.get('SPY')
-    if iwm is None or spy is None:
-        return False
-    threshold = get_threshold('smallcap_weakness_threshold', -2.0)
+    iwm = quotes['IWM']
+    spy = quotes['SPY']
+    threshold = _THRESHOLDS['smallcap_weakness_threshold']
     relative_perf = iwm.intraday_change_pct - spy.intraday_change_pct
     triggered = relative_perf <= threshold
     if triggered:
@@ -215,49 +204,47 @@ def check_smallcap_weakness(snapshot: MarketSnapshot, ctx: dict) -> bool:
     return triggered
 
 
-def check_defensive_hedge_bid(snapshot: MarketSnapshot, ctx: dict) -> bool:
+def check_defensive_hedge_bid(quotes: Quotes, ctx: dict) -> bool:
     """Check for flight to safety (GLD + TLT both up significantly)."""
-    gld = snapshot.get('GLD')
-    tlt = snapshot.get('TLT')
-    if gld is None or tlt is None:
+    threshold = _THRESHOLDS['defensive_hedge_bid']
+    gld_change = quotes['GLD'].intraday_change_pct
+    if not gld_change >= threshold:
         return False
-    threshold = get_threshold('defensive_hedge_bid', 1.5)
-    triggered = gld.intraday_change_pct >= threshold and tlt.intraday_change_pct >= threshold
-    if triggered:
-        ctx['extra'] = {'gld': gld.intraday_change_pct, 'tlt': tlt.intraday_change_pct}
-    return triggered
+    tlt_change = quotes['TLT'].intraday_change_pct
+    if not tlt_change >= threshold:
+        return False
+    ctx['extra'] = {'gld': gld_change, 'tlt': tlt_change}
+    return True
 
 
-def check_combined_stress(snapshot: MarketSnapshot, ctx: dict) -> bool:
+def check_combined_stress(quotes: Quotes, ctx: dict) -> bool:
     """Check for combined equity + bond stress (both selling off)."""
-    spy = snapshot.get('SPY')
-    tlt = snapshot.get('TLT')
-    if spy is None or tlt is None:
-        return False
     # SPY down -2.5% AND TLT negative same day
-    triggered = spy.intraday_change_pct <= -2.5 and tlt.intraday_change_pct < 0
-    if triggered:
-        ctx['extra'] = {'spy': spy.intraday_change_pct, 'tlt': tlt.intraday_change_pct}
-    return triggered
+    spy_change = quotes['SPY'].intraday_change_pct
+    if not spy_change <= -2.5:
+        return False
+    tlt_change = quotes['TLT'].intraday_change_pct
+    if not tlt_change < 0:
+        return False
+    ctx['extra'] = {'spy': spy_change, 'tlt': tlt_change}
+    return True
 
 
-def check_risk_appetite_positive(snapshot: MarketSnapshot, ctx: dict) -> bool:
+def check_risk_appetite_positive(quotes: Quotes, ctx: dict) -> bool:
     """Check for positive risk appetite (broad rally with growth leading)."""
-    spy = snapshot.get('SPY')
-    qqq = snapshot.get('QQQ')
-    if spy is None or qqq is None:
+    spy_change = quotes['SPY'].intraday_change_pct
+    if not spy_change >= 1.5:
         return False
-    triggered = spy.intraday_change_pct >= 1.5 and qqq.intraday_change_pct >= spy.intraday_change_pct
-    if triggered:
-        ctx['extra'] = {'spy': spy.intraday_change_pct, 'qqq': qqq.intraday_change_pct}
-    return triggered
+    qqq_change = quotes['QQQ'].intraday_change_pct
+    if not qqq_change >= spy_change:
+        return False
+    ctx['extra'] = {'spy': spy_change, 'qqq': qqq_change}
+    return True
 
 
-def check_btc_major_move(snapshot: MarketSnapshot, ctx: dict) -> bool:
+def check_btc_major_move(quotes: Quotes, ctx: dict) -> bool:
     """Check for major Bitcoin move (risk sentiment indicator)."""
-    btc = snapshot.get('BTC-USD')
-    if btc is None:
-        return False
+    btc = quotes['BTC-USD']
     triggered = abs(btc.intraday_change_pct) >= 8.0
     if triggered:
         ctx['value'] = btc.intraday_change_pct
@@ -265,155 +252,255 @@ def check_btc_major_move(snapshot: MarketSnapshot, ctx: dict) -> bool:
     return triggered
 
 
-def create_drawdown_checker(level: float):
-    """Factory for SPY drawdown rules at specific levels."""
-    def check(snapshot: MarketSnapshot, ctx: dict) -> bool:
-        spy = snapshot.get('SPY')
-        if spy is None:
-            return False
-        drawdown = get_drawdown_from_high(spy)
-        if drawdown is None:
-            return False
-        # Trigger if drawdown is at or beyond this level but not beyond the next level
-        triggered = drawdown <= level
-        if triggered:
-            ctx['value'] = drawdown
-            ctx['symbol'] = 'SPY'
-        return triggered
-    return check
+def _evaluated_separately(quotes: Quotes, ctx: dict) -> bool:
+    """Placeholder check for rules that evaluate_drawdown fires directly."""
+    return False
 
 
 # Build the rule registry
-RULES: list[Rule] = [
-    # Critical stress rules
-    Rule(
-        name="CREDIT_STRESS_INTRADAY",
-        severity=Severity.CRITICAL,
-        category="Stress",
-        description="High yield bonds dropping sharply intraday",
-        check=check_credit_stress_intraday,
-        message_template="Credit Stress: HYG {value:.1f}% intraday - credit spreads widening",
-    ),
-    Rule(
-        name="COMBINED_STRESS",
-        severity=Severity.CRITICAL,
-        category="Stress",
-        description="Both equities and bonds selling off together",
-        check=check_combined_stress,
-        message_template="Combined Stress: SPY {spy:.1f}% and TLT {tlt:.1f}% - nowhere to hide",
-    ),
-
-    # High severity rules
-    Rule(
-        name="CREDIT_STRESS_5D",
-        severity=Severity.HIGH,
-        category="Stress",
-        description="Sustained high yield weakness over 5 days",
-        check=check_credit_stress_5d,
-        message_template="Credit Stress (5D): HYG {value:.1f}% over 5 days - sustained spread widening",
-    ),
-    Rule(
-        name="LIQUIDITY_STRESS_INTRADAY",
-        severity=Severity.HIGH,
-        category="Stress",
-        description="Dollar spiking sharply (liquidity tightening)",
-        check=check_liquidity_stress_intraday,
-        message_template="Liquidity Stress: DXY +{value:.1f}% intraday - dollar squeeze",
-    ),
-    Rule(
-        name="LIQUIDITY_STRESS_5D",
-        severity=Severity.HIGH,
-        category="Stress",
-        description="Sustained dollar strength over 5 days",
-        check=check_liquidity_stress_5d,
-        message_template="Liquidity Stress (5D): DXY +{value:.1f}% over 5 days - sustained tightening",
-    ),
-    Rule(
-        name="VOLATILITY_ELEVATED",
-        severity=Severity.HIGH,
-        category="Stress",
-        description="VIX at elevated fear levels",
-        check=check_volatility_elevated,
-        message_template="Volatility Elevated: VIX at {value:.1f} - fear gauge elevated",
-    ),
-    Rule(
-        name="VOLATILITY_SPIKE",
-        severity=Severity.HIGH,
-        category="Stress",
-        description="VIX spiking sharply intraday",
-        check=check_volatility_spike,
-        message_template="Volatility Spike: VIX +{value:.1f}% intraday - sudden fear",
-    ),
-
-    # Medium severity - Opportunity/Leadership
-    Rule(
-        name="GROWTH_WEAKNESS",
-        severity=Severity.MEDIUM,
-        category="Leadership",
-        description="Growth/tech underperforming broad market",
-        check=check_growth_weakness,
-        message_template="Growth Weakness: QQQ underperforming SPY by {value:.1f}%",
-    ),
-    Rule(
-        name="SMALLCAP_WEAKNESS",
-        severity=Severity.MEDIUM,
-        category="Leadership",
-        description="Small caps underperforming (risk-off signal)",
-        check=check_smallcap_weakness,
-        message_template="Small Cap Weakness: IWM underperforming SPY by {value:.1f}%",
-    ),
-    Rule(
-        name="DEFENSIVE_HEDGE_BID",
-        severity=Severity.MEDIUM,
-        category="Sentiment",
-        description="Flight to safety into gold and treasuries",
-        check=check_defensive_hedge_bid,
-        message_template="Defensive Bid: GLD +{gld:.1f}% and TLT +{tlt:.1f}% - flight to safety",
-    ),
-
-    # Low severity - Informational
-    Rule(
-        name="RISK_APPETITE_POSITIVE",
-        severity=Severity.LOW,
-        category="Sentiment",
-        description="Positive risk appetite with growth leading",
-        check=check_risk_appetite_positive,
-        message_template="Risk-On: SPY +{spy:.1f}% with QQQ +{qqq:.1f}% - growth leading",
-    ),
-    Rule(
-        name="BTC_MAJOR_MOVE",
-        severity=Severity.LOW,
-        category="Sentiment",
-        description="Major Bitcoin move (risk sentiment proxy)",
-        check=check_btc_major_move,
-        message_template="Crypto Signal: BTC {value:+.1f}% - major move in risk sentiment proxy",
-    ),
-]
-
-# Add SPY drawdown rules at different levels
 DRAWDOWN_LEVELS = [-2, -4, -6, -10, -15, -20]
-for level in DRAWDOWN_LEVELS:
-    abs_level = abs(level)
-    severity = Severity.MEDIUM if abs_level <= 6 else Severity.HIGH
-
-    RULES.append(Rule(
-        name=f"SPY_DRAWDOWN_{abs_level}PCT",
-        severity=severity,
-        category="Opportunity",
-        description=f"SPY drawdown at {abs_level}% from 52-week high",
-        check=create_drawdown_checker(level),
-        message_template=f"Drawdown Alert: SPY {{value:.1f}}% from high - {abs_level}% threshold",
-    ))
+# Deepest level first, for bisecting a drawdown against the levels
+_SORTED_LEVELS = sorted(DRAWDOWN_LEVELS)
+
+
+def _build_rules() -> list[Rule]:
+    """Build the rule registry, binding the current thresholds into checks."""
+    t = _THRESHOLDS
+    rules = [
+        # Critical stress rules
+        Rule(
+            name="CREDIT_STRESS_INTRADAY",
+            severity=Severity.CRITICAL,
+            category="Stress",
+            description="High yield bonds dropping sharply intraday",
+            check=make_threshold_check(
+                'HYG', _get_intraday, operator.le, t['credit_stress_intraday'], 'HYG',
+            ),
+            message_template="Credit Stress: HYG {value:.1f}% intraday - credit spreads widening",
+            symbols=('HYG',),
+        ),
+        Rule(
+            name="COMBINED_STRESS",
+            severity=Severity.CRITICAL,
+            category="Stress",
+            description="Both equities and bonds selling off together",
+            check=check_combined_stress,
+            message_template="Combined Stress: SPY {spy:.1f}% and TLT {tlt:.1f}% - nowhere to hide",
+            symbols=('SPY', 'TLT'),
+        ),
+
+        # High severity rules
+        Rule(
+            name="CREDIT_STRESS_5D",
+            severity=Severity.HIGH,
+            category="Stress",
+            description="Sustained high yield weakness over 5 days",
+            check=make_threshold_check(
+                'HYG', _get_5d, operator.le, t['credit_stress_5d'], 'HYG',
+            ),
+            message_template="Credit Stress (5D): HYG {value:.1f}% over 5 days - sustained spread widening",
+            symbols=('HYG',),
+        ),
+        Rule(
+            name="LIQUIDITY_STRESS_INTRADAY",
+            severity=Severity.HIGH,
+            category="Stress",
+            description="Dollar spiking sharply (liquidity tightening)",
+            check=make_threshold_check(
+                'DX-Y.NYB', _get_intraday, operator.ge, t['liquidity_stress_intraday'], 'DXY',
+            ),
+            message_template="Liquidity Stress: DXY +{value:.1f}% intraday - dollar squeeze",
+            symbols=('DX-Y.NYB',),
+        ),
+        Rule(
+            name="LIQUIDITY_STRESS_5D",
+            severity=Severity.HIGH,
+            category="Stress",
+            description="Sustained dollar strength over 5 days",
+            check=make_threshold_check(
+                'DX-Y.NYB', _get_5d, operator.ge, t['liquidity_stress_5d'], 'DXY',
+            ),
+            message_template="Liquidity Stress (5D): DXY +{value:.1f}% over 5 days - sustained tightening",
+            symbols=('DX-Y.NYB',),
+        ),
+        Rule(
+            name="VOLATILITY_ELEVATED",
+            severity=Severity.HIGH,
+            category="Stress",
+            description="VIX at elevated fear levels",
+            check=make_threshold_check(
+                '^VIX', _get_price, operator.ge, t['volatility_level'], 'VIX',
+            ),
+            message_template="Volatility Elevated: VIX at {value:.1f} - fear gauge elevated",
+            symbols=('^VIX',),
+        ),
+        Rule(
+            name="VOLATILITY_SPIKE",
+            severity=Severity.HIGH,
+            category="Stress",
+            description="VIX spiking sharply intraday",
+            check=make_threshold_check(
+                '^VIX', _get_intraday, operator.ge, t['volatility_spike'], 'VIX',
+            ),
+            message_template="Volatility Spike: VIX +{value:.1f}% intraday - sudden fear",
+            symbols=('^VIX',),
+        ),
+
+        # Medium severity - Opportunity/Leadership
+        Rule(
+            name="GROWTH_WEAKNESS",
+            severity=Severity.MEDIUM,
+            category="Leadership",
+            description="Growth/tech underperforming broad market",
+            check=check_growth_weakness,
+            message_template="Growth Weakness: QQQ underperforming SPY by {value:.1f}%",
+            symbols=('QQQ', 'SPY'),
+        ),
+        Rule(
+            name="SMALLCAP_WEAKNESS",
+            severity=Severity.MEDIUM,
+            category="Leadership",
+            description="Small caps underperforming (risk-off signal)",
+            check=check_smallcap_weakness,
+            message_template="Small Cap Weakness: IWM underperforming SPY by {value:.1f}%",
+            symbols=('IWM', 'SPY'),
+        ),
+        Rule(
+            name="DEFENSIVE_HEDGE_BID",
+            severity=Severity.MEDIUM,
+            category="Sentiment",
+            description="Flight to safety into gold and treasuries",
+            check=check_defensive_hedge_bid,
+            message_template="Defensive Bid: GLD +{gld:.1f}% and TLT +{tlt:.1f}% - flight to safety",
+            symbols=('GLD', 'TLT'),
+        ),
+
+        # Low severity - Informational
+        Rule(
+            name="RISK_APPETITE_POSITIVE",
+            severity=Severity.LOW,
+            category="Sentiment",
+            description="Positive risk appetite with growth leading",
+            check=check_risk_appetite_positive,
+            message_template="Risk-On: SPY +{spy:.1f}% with QQQ +{qqq:.1f}% - growth leading",
+            symbols=('SPY', 'QQQ'),
+        ),
+        Rule(
+            name="BTC_MAJOR_MOVE",
+            severity=Severity.LOW,
+            category="Sentiment",
+            description="Major Bitcoin move (risk sentiment proxy)",
+            check=check_btc_major_move,
+            message_template="Crypto Signal: BTC {value:+.1f}% - major move in risk sentiment proxy",
+            symbols=('BTC-USD',),
+        ),
+    ]
+    return rules
+
+
+def _build_drawdown_rules() -> list[Rule]:
+    """Build one SPY drawdown rule per level, aligned with _SORTED_LEVELS."""
+    rules = []
+    for level in _SORTED_LEVELS:
+        abs_level = abs(level)
+        severity = Severity.MEDIUM if abs_level <= 6 else Severity.HIGH
+
+        rules.append(Rule(
+            name=f"SPY_DRAWDOWN_{abs_level}PCT",
+            severity=severity,
+            category="Opportunity",
+            description=f"SPY drawdown at {abs_level}% from 52-week high",
+            # All levels are matched in one bisect pass by evaluate_drawdown
+            check=_evaluated_separately,
+            message_template=f"Drawdown Alert: SPY {{value:.1f}}% from high - {abs_level}% threshold",
+            symbols=('SPY',),
+        ))
+
+    return rules
+
+
+RULES: list[Rule] = _build_rules()
+
+# Evaluated in a single pass by evaluate_drawdown rather than via RULES
+DRAWDOWN_RULES: list[Rule] = _build_drawdown_rules()
+
+
+# Symbol -> positions in RULES of the rules that read it
+_SYMBOL_INDEX: dict[str, list[int]] = defaultdict(list)
+
+# Positions in RULES of rules that read no symbols (always candidates)
+_UNSCOPED_RULES: list[int] = []
+
+
+# Rule name -> rule, covering RULES and DRAWDOWN_RULES
+_RULES_BY_NAME: dict[str, Rule] = {}
+
+
+def _index_rules() -> None:
+    """Rebuild the symbol and name indexes over the registry."""
+    _SYMBOL_INDEX.clear()
+    _UNSCOPED_RULES.clear()
+    for i, rule in enumerate(RULES):
+        if not rule.symbols:
+            _UNSCOPED_RULES.append(i)
+        for symbol in rule.symbols:
+            _SYMBOL_INDEX[symbol].append(i)
+
+    _RULES_BY_NAME.clear()
+    _RULES_BY_NAME.update((rule.name, rule) for rule in RULES + DRAWDOWN_RULES)
+
+
+_index_rules()
+
+
+def reload_config() -> None:
+    """Re-read config and rebuild thresholds, cooldowns and rules in place."""
+    _load_tables()
+    RULES[:] = _build_rules()
+    DRAWDOWN_RULES[:] = _build_drawdown_rules()
+    _index_rules()
+
+
+def _candidate_rules(snapshot: MarketSnapshot) -> list[Rule]:
+    """Rules whose required symbols are all in the snapshot, in RULES order."""
+    hits = Counter(i for symbol in snapshot.data for i in _SYMBOL_INDEX.get(symbol, ()))
+    ready = [i for i in hits if hits[i] == len(RULES[i].symbols)]
+    return [RULES[i] for i in sorted(ready + _UNSCOPED_RULES)]
+
+
+def evaluate_drawdown(quotes: Quotes, triggered: list[TriggeredRule]) -> None:
+    """
+    Append the deepest SPY drawdown rule reached, if any.
+
+    The drawdown is computed once and bisected against the sorted levels,
+    so only the most severe level breached fires.
+    """
+    spy = quotes.get('SPY')
+    if spy is None:
+        return
+    drawdown = get_drawdown_from_high(spy)
+    if drawdown is None:
+        return
+    # First level at or above the drawdown is the deepest one breached
+    i = bisect_left(_SORTED_LEVELS, drawdown)
+    if i < len(_SORTED_LEVELS):
+        triggered.append(TriggeredRule(rule=DRAWDOWN_RULES[i], value=drawdown, symbol='SPY'))
 
 
 def evaluate_rules(snapshot: MarketSnapshot) -> list[TriggeredRule]:
-    """Evaluate all rules against current market snapshot."""
+    """
+    Evaluate all rules against current market snapshot.
+
+    Rules whose symbols are missing from the snapshot are skipped, so
+    checks can index the snapshot's quotes directly.
+    """
     triggered = []
+    quotes = snapshot.data
 
-    for rule in RULES:
+    for rule in _candidate_rules(snapshot):
         ctx: dict = {}
         try:
-            if rule.check(snapshot, ctx):
+            if rule.check(quotes, ctx):
                 triggered.append(TriggeredRule(
                     rule=rule,
                     value=ctx.get('value'),
@@ -423,12 +510,10 @@ def evaluate_rules(snapshot: MarketSnapshot) -> list[TriggeredRule]:
         except Exception as e:
             print(f"Error evaluating rule {rule.name}: {e}")
 
+    evaluate_drawdown(quotes, triggered)
     return triggered
 
 
 def get_rule_by_name(name: str) -> Optional[Rule]:
     """Get a rule by its name."""
-    for rule in RULES:
-        if rule.name == name:
-            return rule
-    return None
+    return _RULES_BY_NAME.get(name)
@@ -2,13 +2,33 @@
 
 import json
 import os
-from datetime import datetime, timedelta
+import tempfile
+from datetime import datetime
 from typing import Optional
-from src.rules import Severity, get_cooldown_minutes
+from src.rules import DRAWDOWN_RULES, RULES, Severity, TriggeredRule, get_cooldown_delta
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
 
 STATE_FILE = "state.json"
 
+# Fires are appended to <state file>.log as "timestamp<TAB>rule name" lines and
+# folded into the state file once the log is this many times the rule count
+LOG_SUFFIX = ".log"
+COMPACT_FACTOR = 10
+
+# Parsed state (plus its last_alerts timestamps as datetimes and the number of
+# log lines replayed into it), reused until the state or log file's mtime changes
+_state_cache = {"mtime": None, "data": None, "last_fires": {}, "log_lines": 0}
+
 
 def _get_state_path() -> str:
     """Get path to state file."""
@@ -19,27 +39,130 @@ def _get_state_path() -> str:
     return os.path.join(project_root, STATE_FILE)
 
 
+def _get_log_path(state_path: str) -> str:
+    """Get path to the append-only fire log next to the state file."""
+    return state_path + LOG_SUFFIX
+
+
+def _get_mtime(path: str) -> Optional[int]:
+    """Get file modification time in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _flush_state() -> None:
+    """Drop the in-memory state cache so the next load re-reads the file."""
+    _state_cache["mtime"] = None
+    _state_cache["data"] = None
+    _state_cache["last_fires"] = {}
+    _state_cache["log_lines"] = 0
+
+
+def _parse_last_alerts(last_alerts: dict) -> dict[str, datetime]:
+    """Parse ISO fire times, skipping any that are invalid."""
+    last_fires = {}
+    for rule_name, last_fire_str in last_alerts.items():
+        try:
+            last_fires[rule_name] = datetime.fromisoformat(last_fire_str)
+        except (ValueError, TypeError):
+            pass
+    return last_fires
+
+
+def _replay_log(log_path: str, last_alerts: dict) -> int:
+    """Apply fire log lines to last_alerts (latest wins); return lines read."""
+    count = 0
+    with open(log_path, 'r') as f:
+        for line in f:
+            fired_at, sep, rule_name = line.rstrip("\n").partition("\t")
+            if sep and rule_name:
+                last_alerts[rule_name] = fired_at
+            count += 1
+    return count
+
+
 def load_state() -> dict:
-    """Load state from JSON file."""
+    """
+    Load state from the JSON file plus any fires appended to its log.
+
+    The parsed state is cached until either file changes on disk, so the
+    returned dict is shared: mutate it only to pass it to save_state.
+    """
     state_path = _get_state_path()
+    log_path = _get_log_path(state_path)
+    mtime = (_get_mtime(state_path), _get_mtime(log_path))
+    if mtime != (None, None) and mtime == _state_cache["mtime"]:
+        return _state_cache["data"]
+
+    state = {"last_alerts": {}, "version": 1}
+    if mtime == (None, None):
+        return state
+
     try:
-        if os.path.exists(state_path):
-            with open(state_path, 'r') as f:
-                return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        if mtime[0] is not None:
+            with open(state_path, 'rb') as f:
+                state = _loads(f.read())
+    except (ValueError, IOError) as e:
         print(f"Warning: Could not load state file: {e}")
 
-    return {"last_alerts": {}, "version": 1}
+    log_lines = 0
+    try:
+        if mtime[1] is not None:
+            log_lines = _replay_log(log_path, state.setdefault("last_alerts", {}))
+    except (ValueError, IOError) as e:
+        print(f"Warning: Could not read state log: {e}")
+
+    _state_cache["mtime"] = mtime
+    _state_cache["data"] = state
+    _state_cache["last_fires"] = _parse_last_alerts(state.get("last_alerts", {}))
+    _state_cache["log_lines"] = log_lines
+    return state
+
+
+def _get_last_fires() -> dict[str, datetime]:
+    """Get each rule's last fire time from the (cached) state."""
+    state = load_state()
+    if state is _state_cache["data"]:
+        return _state_cache["last_fires"]
+    return _parse_last_alerts(state.get("last_alerts", {}))
 
 
 def save_state(state: dict) -> None:
-    """Save state to JSON file."""
+    """
+    Save state to JSON file (atomically, via a temp file and rename).
+
+    The saved state replaces everything in the fire log, so the log is
+    removed afterwards.
+    """
+    # record_fires stores ISO strings, but a legacy or hand-edited state file
+    # may not; such entries never parse as a fire time, so drop them
+    last_alerts = state.get("last_alerts") or {}
+    for rule_name in [k for k, v in last_alerts.items() if not isinstance(v, str)]:
+        del last_alerts[rule_name]
+
     state_path = _get_state_path()
+    state_dir = os.path.dirname(os.path.abspath(state_path))
+    tmp_path = None
     try:
-        with open(state_path, 'w') as f:
-            json.dump(state, f, indent=2, default=str)
+        fd, tmp_path = tempfile.mkstemp(dir=state_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_dumps(state))
+        os.replace(tmp_path, state_path)
+        tmp_path = None
+        log_path = _get_log_path(state_path)
+        if os.path.exists(log_path):
+            os.remove(log_path)
+        _state_cache["mtime"] = (_get_mtime(state_path), None)
+        _state_cache["data"] = state
+        _state_cache["last_fires"] = _parse_last_alerts(state.get("last_alerts", {}))
+        _state_cache["log_lines"] = 0
     except IOError as e:
         print(f"Warning: Could not save state file: {e}")
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def should_fire(rule_name: str, severity: Severity) -> bool:
@@ -50,50 +173,81 @@ def should_fire(rule_name: str, severity: Severity) -> bool:
     - Rule has never fired before
     - Enough time has passed since last fire (based on severity cooldown)
     """
-    state = load_state()
-    last_alerts = state.get("last_alerts", {})
-
-    if rule_name not in last_alerts:
-        return True
-
-    last_fire_str = last_alerts[rule_name]
-    try:
-        last_fire = datetime.fromisoformat(last_fire_str)
-    except (ValueError, TypeError):
+    last_fire = _get_last_fires().get(rule_name)
+    if last_fire is None:
         return True
 
-    cooldown_minutes = get_cooldown_minutes(severity)
-    cooldown_delta = timedelta(minutes=cooldown_minutes)
-
-    return datetime.now() - last_fire >= cooldown_delta
+    return datetime.now() - last_fire >= get_cooldown_delta(severity)
 
 
 def record_fire(rule_name: str) -> None:
     """Record that an alert was fired."""
-    state = load_state()
-    if "last_alerts" not in state:
-        state["last_alerts"] = {}
+    record_fires([rule_name])
 
-    state["last_alerts"][rule_name] = datetime.now().isoformat()
-    save_state(state)
 
+def filter_due(triggered: list[TriggeredRule], now: Optional[datetime] = None) -> list[TriggeredRule]:
+    """Return the triggered rules whose cooldown has expired, reading state once."""
+    now = now or datetime.now()
+    last_fires = _get_last_fires()
 
-def get_last_fire_time(rule_name: str) -> Optional[datetime]:
-    """Get the last time a rule was fired."""
-    state = load_state()
-    last_alerts = state.get("last_alerts", {})
+    due = []
+    for tr in triggered:
+        last_fire = last_fires.get(tr.rule.name)
+        if last_fire is not None and now - last_fire < get_cooldown_delta(tr.rule.severity):
+            continue
+        due.append(tr)
+    return due
 
-    if rule_name not in last_alerts:
-        return None
 
+def record_fires(rule_names: list[str], now: Optional[datetime] = None) -> None:
+    """
+    Record that several alerts were fired, with a single append to the fire log.
+
+    The log is compacted into the state file once it holds more than
+    COMPACT_FACTOR lines per rule.
+    """
+    if not rule_names:
+        return
+    now = now or datetime.now()
+    fired_at = now.isoformat()
+    state = load_state()
+
+    state_path = _get_state_path()
+    log_path = _get_log_path(state_path)
     try:
-        return datetime.fromisoformat(last_alerts[rule_name])
-    except (ValueError, TypeError):
-        return None
+        with open(log_path, 'a') as f:
+            f.write("".join(f"{fired_at}\t{rule_name}\n" for rule_name in rule_names))
+    except IOError as e:
+        print(f"Warning: Could not append to state log: {e}")
+        return
+
+    last_alerts = state.setdefault("last_alerts", {})
+    for rule_name in rule_names:
+        last_alerts[rule_name] = fired_at
+
+    if state is not _state_cache["data"]:
+        # Nothing on disk was cached yet; read back the log just written
+        load_state()
+        return
+
+    last_fires = _state_cache["last_fires"]
+    for rule_name in rule_names:
+        last_fires[rule_name] = now
+    _state_cache["mtime"] = (_get_mtime(state_path), _get_mtime(log_path))
+    _state_cache["log_lines"] += len(rule_names)
+
+    if _state_cache["log_lines"] > COMPACT_FACTOR * (len(RULES) + len(DRAWDOWN_RULES)):
+        save_state(state)
+
+
+def get_last_fire_time(rule_name: str) -> Optional[datetime]:
+    """Get the last time a rule was fired."""
+    return _get_last_fires().get(rule_name)
 
 
 def clear_cooldowns() -> None:
     """Clear all cooldowns (for testing/reset)."""
+    _flush_state()
     state = {"last_alerts": {}, "version": 1}
     save_state(state)
 
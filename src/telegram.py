@@ -1,8 +1,59 @@
 """Telegram API wrapper for sending messages."""
 
+import functools
 import os
-import requests
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Telegram rejects sendMessage text longer than this
+MAX_MESSAGE_LENGTH = 4096
+
+
+@functools.lru_cache(maxsize=1)
+def _session() -> "requests.Session":
+    """
+    Get the shared session that keeps the TLS connection to Telegram open.
+
+    requests is imported here rather than at module load, so runs that
+    send nothing never pay for it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class SendRetry(Retry):
+        # sendMessage is not idempotent: after a 5xx the message may already be
+        # delivered, so POSTs are only retried on 429 (rejected, nothing sent)
+        def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+            if method.upper() == "POST":
+                return status_code == 429
+            return super().is_retry(method, status_code, has_retry_after)
+
+    # Connection errors are retried for any method since nothing was sent;
+    # read errors only for GET, the one method listed in allowed_methods
+    retry = SendRetry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry))
+    return session
 
 
 def get_credentials() -> tuple[Optional[str], Optional[str]]:
@@ -12,6 +63,13 @@ def get_credentials() -> tuple[Optional[str], Optional[str]]:
     return bot_token, chat_id
 
 
+@functools.lru_cache(maxsize=1)
+def _bot_urls(bot_token: str) -> tuple[str, str]:
+    """Build (send_url, getme_url) for a bot token, once per token."""
+    base_url = f"https://api.telegram.org/bot{bot_token}"
+    return f"{base_url}/sendMessage", f"{base_url}/getMe"
+
+
 def send_message(text: str, parse_mode: str = "Markdown") -> bool:
     """
     Send a message via Telegram bot.
@@ -29,7 +87,9 @@ def send_message(text: str, parse_mode: str = "Markdown") -> bool:
         print("Error: TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID not set")
         return False
 
-    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    import requests
+
+    url, _ = _bot_urls(bot_token)
 
     payload = {
         "chat_id": chat_id,
@@ -39,7 +99,7 @@ def send_message(text: str, parse_mode: str = "Markdown") -> bool:
     }
 
     try:
-        response = requests.post(url, json=payload, timeout=30)
+        response = _session().post(url, data=_dumps(payload), headers=_JSON_HEADERS, timeout=30)
         response.raise_for_status()
 
         result = response.json()
@@ -73,18 +133,54 @@ def send_message_safe(text: str) -> bool:
     return send_message(plain_text, parse_mode="")
 
 
+def _chunk_messages(texts: list[str], limit: int = MAX_MESSAGE_LENGTH) -> list[str]:
+    """
+    Pack texts into as few messages as possible, each at most limit chars.
+
+    Texts are joined with a blank line; a single text longer than the limit
+    is split into limit-sized pieces.
+    """
+    chunks = []
+    current = ""
+    for text in texts:
+        for start in range(0, len(text), limit):
+            piece = text[start:start + limit]
+            if not current:
+                current = piece
+            elif len(current) + 2 + len(piece) <= limit:
+                current = f"{current}\n\n{piece}"
+            else:
+                chunks.append(current)
+                current = piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def send_messages_safe(texts: list[str]) -> bool:
+    """
+    Send several texts in as few Telegram messages as the length limit allows.
+
+    Returns True only if every chunk was sent.
+    """
+    results = [send_message_safe(chunk) for chunk in _chunk_messages(texts)]
+    return bool(results) and all(results)
+
+
 def test_connection() -> bool:
     """Test Telegram bot connection."""
-    bot_token, chat_id = get_credentials()
+    bot_token, _ = get_credentials()
 
     if not bot_token:
         print("TELEGRAM_BOT_TOKEN not set")
         return False
 
-    url = f"https://api.telegram.org/bot{bot_token}/getMe"
+    import requests
+
+    _, url = _bot_urls(bot_token)
 
     try:
-        response = requests.get(url, timeout=10)
+        response = _session().get(url, timeout=10)
         response.raise_for_status()
 
         result = response.json()